@@ -1,5 +1,7 @@
 import re
 
+STRIP_RX = re.compile('[a-zA-Z,.:()" "]')
+
 print("Our Magical Calculator")
 print("Type 'quit' to exit\n")
 
@@ -20,7 +22,7 @@ def performMath():
         print("Goodbye, This program was designed by Hassan Shahin")
         run = False
     else:
-        equation = re.sub('[a-zA-Z,.:()" "]', '', equation)
+        equation = STRIP_RX.sub('', equation)
         if previous == 0:
             previous = eval(equation)
         else:
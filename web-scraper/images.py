@@ -1,35 +1,54 @@
 from bs4 import BeautifulSoup
 import requests
 from PIL import Image
-from io import BytesIO
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
-def StartSearch():
+session = requests.Session()
+session.headers.update({"User-Agent": "Mozilla/5.0"})
+
+def search_once():
     search = input("search for:")
     params = {"q": search}
-    
+
     dir_name = search.replace(" ", "_").lower()
-    
+
     if not os.path.isdir(dir_name):
         os.makedirs(dir_name)
-    
-    r = requests.get("http://www.bing.com/images/search", params=params)
 
-    soub = BeautifulSoup(r.text, "html.parser")
+    r = session.get("http://www.bing.com/images/search", params=params)
+
+    soub = BeautifulSoup(r.text, "lxml")
     links = soub.findAll("a", {"class": "thumb"})
 
-    for item in links:
+    def fetch_and_save(href):
         try:
-            img_obj = requests.get(item.attrs["href"])
-            print("getting", item.attrs["href"])
-            title = item.attrs["href"].split("/")[-1]
-            try:
-                img = Image.open(BytesIO(img_obj.content))
-                img.save("./"+ dir_name +"/" + title, img.format)
-            except:
-                print("could not save image")
+            print("getting", href)
+            title = href.split("/")[-1]
+            path = "./" + dir_name + "/" + title
+            with session.get(href, stream=True) as img_obj:
+                img_obj.raise_for_status()
+                img_obj.raw.decode_content = True
+                try:
+                    with open(path, "wb") as f:
+                        shutil.copyfileobj(img_obj.raw, f)
+                    Image.open(path).verify()
+                except:
+                    print("could not save image")
+                    if os.path.exists(path):
+                        os.remove(path)
         except:
             print("could not request image")
-    StartSearch()
-    
-StartSearch()
\ No newline at end of file
+
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        list(ex.map(fetch_and_save, [item.attrs.get("href") for item in links if item.attrs.get("href")]))
+
+
+def main():
+    while True:
+        search_once()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
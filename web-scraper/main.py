@@ -7,7 +7,7 @@ params = {"q": search}
 
 data = r.get('http://www.bing.com/search', params=params)
 
-soup = BeautifulSoup(data.text, "html.parser")
+soup = BeautifulSoup(data.text, "lxml")
 
 # print(soup.prettify())
 